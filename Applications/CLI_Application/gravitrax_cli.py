@@ -1,341 +1,397 @@
-"""Gravitrax Example Script: Using Keyboard buttons to send signals.
-This script binds the sending of signals to Keyboard Buttons. Received 
-Notifications are displayed.
-The input for the status and stonetype can be done by typing the name of the
-intended Stone or the int value. 
-"""
-
-import asyncio
-
-
-from threading import Lock
-from concurrent.futures import ThreadPoolExecutor
-from pynput.keyboard import Listener, Key
-from gravitraxconnect import gravitrax_bridge as gb
-from gravitraxconnect import gravitrax_constants as gv
-
-# pylint: disable=global-statement
-# pylint: disable=global-variable-not-assigned
-# pylint: disable=invalid-name
-
-gravitrax_cli = "\
-                                          ><<                                 ><<    ><<       ><< \n\
-                                      ><  ><<                              ><<   ><< ><<       ><< \n\
-   ><<   >< ><<<   ><<    ><<     ><<   ><>< ><>< ><<<   ><<    ><<   ><< ><<        ><<       ><< \n\
- ><<  ><< ><<    ><<  ><<  ><<   ><< ><<  ><<   ><<    ><<  ><<   >< ><<  ><<        ><<       ><< \n\
-><<   ><< ><<   ><<   ><<   ><< ><<  ><<  ><<   ><<   ><<   ><<    ><     ><<        ><<       ><< \n\
- ><<  ><< ><<   ><<   ><<    ><><<   ><<  ><<   ><<   ><<   ><<  ><  ><<   ><<   ><< ><<       ><< \n\
-     ><< ><<<     ><< ><<<    ><<    ><<   ><< ><<<     ><< ><<<><<   ><<    ><<<<   ><<<<<<<< ><< \n\
-  ><<                                                                                             "
-
-key_info = "\
-========================================================\n\
-|   Keys:                                              |\n\
-|   r,g,b:  Send Red/Green/Blue Signal                 |\n\
-|   k:      Send Signals in a fixed interval           |\n\
-|   s:      Change the Status value of send signals    |\n\
-|   t:      Change the stonetype of send signals       |\n\
-|   u:      Send unlock signal                         |\n\
-|   l:      Send lock signal                           |\n\
-|   Esc:    Disconnect and close the program.          |\n\
-|   Ctrl+C: Close the program.                         |\n\
-========================================================"
-
-b = gb.Bridge()
-input_Lock = Lock()
-finished = None
-loop = None
-listener = None
-
-# Signal Parameter
-status = gv.STATUS_ALL
-stone = gv.STONE_BRIDGE
-
-notif_counter = 0  # Tracks how many Notifications where received
-
-
-def print_input_info(name, dictionary: dict):
-    """Prints out the key/value pairs of a dictionary.
-    Used to provide additional information for user inputs.
-    """
-    print("=============================================")
-    print(f"|{name:20} |{'value':20} |")
-    for key, value in dictionary.items():
-        print(f"|{key:20} | {value:20}|")
-    print("=============================================")
-
-
-async def asyncinput(prompt="") -> str:
-    """input that is run asynchronously"""
-    # Flush keyboard buffer before getting input
-    try:
-        import sys  # pylint: disable=import-outside-toplevel
-        import termios  # pylint: disable=import-outside-toplevel
-
-        termios.tcflush(sys.stdin, termios.TCIOFLUSH)
-    except ImportError:
-        import msvcrt  # pylint: disable=import-outside-toplevel
-
-        while msvcrt.kbhit():
-            msvcrt.getch()
-
-    with ThreadPoolExecutor(1, "asyncinput") as executor:
-        return (
-            await asyncio.get_running_loop().run_in_executor(executor, input, prompt)
-        ).rstrip()
-
-
-def disconnect_callback(bridge: gb.Bridge, **kwargs):
-    """Callback function that is executed when the bridge disconnects"""
-    if kwargs.get("by_timeout"):
-        gb.log_print("Disconnect timed out", bridge=bridge)
-        finished.set()
-    elif kwargs.get("user_disconnected"):
-        gb.log_print("Successfully Disconnected", bridge=bridge)
-        finished.set()
-    else:
-        gb.log_print("Connection to Bridge was interrupted", bridge=bridge)
-
-
-def sanitize_input(user_input, cast_to=int, unsigned=True):
-    """Cast a user input into a positive int value."""
-    try:
-        user_input = cast_to(user_input)
-        if unsigned and user_input < 0:
-            raise ValueError("Input of negative number is not allowed")
-        return user_input
-    except (ValueError, TypeError):
-        return None
-    except:  # pylint: disable=bare-except
-        return None
-
-
-async def color_input(prompt):
-    """User Input for a color value"""
-    red_list = ["red", "r", "rot", "1"]
-    green_list = [
-        "green",
-        "g",
-        "grün",
-        "gruen",
-        "2",
-    ]
-    blue_list = [
-        "blue",
-        "b",
-        "blau",
-        "3",
-    ]
-
-    user_input = await asyncinput(prompt)
-    if user_input.lower() in red_list:
-        return gv.COLOR_RED
-    elif user_input.lower() in green_list:
-        return gv.COLOR_GREEN
-    elif user_input.lower() in blue_list:
-        return gv.COLOR_BLUE
-    return 0
-
-
-async def stone_input(prompt):
-    """User Input for a stone value"""
-    global stone, input_Lock
-    input_Lock.acquire()
-    print_input_info("Stonetype", gv.DICT_STONE)
-    user_input = (await asyncinput(prompt)).lower()
-    try:
-        stone = gv.DICT_STONE[user_input]
-    except KeyError:
-        if not (stone := sanitize_input(user_input, int)) or stone > 255:
-            stone = gv.STONE_BRIDGE
-            gb.log_print("Unknown Stonetype Value")
-    try:
-        gb.log_print(f"Stonetype switched to {gv.DICT_VAL_STONE[stone]}", bridge=b)
-    except KeyError:
-        gb.log_print(f"Stonetype switched to {stone}", bridge=b)
-    finally:
-        input_Lock.release()
-
-
-async def status_input(prompt):
-    """User input for a status value"""
-    global status, input_Lock
-    input_Lock.acquire()
-    print_input_info("Status", gv.DICT_STATUS)
-    user_input = (await asyncinput(prompt)).upper()
-    try:
-        status = gv.DICT_STATUS[user_input]
-    except KeyError:
-        if not (status := sanitize_input(user_input, int)) or status > 255:
-            status = gv.STATUS_ALL
-            gb.log_print("Unknown Status Value")
-    try:
-        gb.log_print(
-            f"Message Status switched to {gv.DICT_VAL_STATUS[status]}", bridge=b
-        )
-    except KeyError:
-        gb.log_print(f"Message Status switched to {status}", bridge=b)
-    finally:
-        input_Lock.release()
-
-
-async def send_signals():
-    """Get signal information from the user and sends the specified Signals"""
-    global status, stone, input_Lock, finished
-    input_Lock.acquire()
-    try:
-        user_input = await asyncinput("Enter the signal count: ")
-        count = sanitize_input(user_input, int)
-        if count is None:
-            gb.log_print("Unknown input")
-            return
-        if not (color := await color_input("Enter the color of the signal(r,g,b): ")):
-            gb.log_print("Unknown input")
-            return
-        user_input = await asyncinput("Enter the time in sec between each signal:")
-        gap = sanitize_input(user_input, float)
-        input_Lock.release()
-        gb.log_print("Sending Signals")
-        await b.send_periodic(
-            status,
-            color,
-            count=count,
-            stone=stone,
-            gap=gap,
-            resend_gap=0,
-            resends=12,
-        )
-    except asyncio.CancelledError:
-        finished.set()
-        if input_Lock.locked():
-            input_Lock.release()
-        return
-
-
-async def notification_callback(bridge: gb.Bridge, **signal):
-    """Callback function that is executed when a notification is received"""
-
-    def lookup(key, table, prefix: str):
-        try:
-            return table[key]
-        except (KeyError, IndexError):
-            if prefix:
-                return f"{prefix}{key}"
-            return key
-
-    global notif_counter
-    notif_counter += 1
-    if signal.get("Header"):  # Check if Notification was a signal
-        sig_status = lookup(signal.get("Status"), gv.DICT_VAL_STATUS, None)
-        sig_stone = lookup(signal.get("Stone"), gv.DICT_VAL_STONE, None)
-        sig_color = lookup(signal.get("Color"), gv.LOOKUP_COLOR, "Color")
-
-        gb.log_print(
-            f"{sig_color:5} detected from Stone",
-            f" {sig_stone} with Status {sig_status}",
-            f"( {notif_counter} Notifications received )",
-            bridge=bridge,
-        )
-    else:
-        gb.log_print(f"New Notification: {signal.get('Data')}", bridge=bridge)
-
-
-def on_press(key):
-    """Handling of keyboard presses"""
-    global b, status, finished, stone, listener, loop
-
-    if key == Key.esc:
-        asyncio.run_coroutine_threadsafe(
-            b.disconnect(timeout=15, dc_callback_on_timeout=True), loop
-        )
-        listener.stop()
-    elif input_Lock.locked():
-        return
-    try:
-        k = key.char
-    except:  # pylint: disable=bare-except
-        k = key.name
-    if k == "r":
-        asyncio.run_coroutine_threadsafe(
-            b.send_signal(status, gv.COLOR_RED, stone=stone), loop
-        )
-    elif k == "g":
-        asyncio.run_coroutine_threadsafe(
-            b.send_signal(status, gv.COLOR_GREEN, stone=stone), loop
-        )
-    elif k == "b":
-        asyncio.run_coroutine_threadsafe(
-            b.send_signal(status, gv.COLOR_BLUE, stone=stone), loop
-        )
-
-    elif k == "u":
-        asyncio.run_coroutine_threadsafe(
-            b.send_signal(gv.STATUS_UNLOCK, gv.COLOR_RED), loop
-        )
-    elif k == "l":
-        asyncio.run_coroutine_threadsafe(
-            b.send_signal(gv.STATUS_LOCK, gv.COLOR_RED), loop
-        )
-
-
-def on_release(key):
-    """handling of keyboard releases"""
-    global b, loop
-    if input_Lock.locked():
-        return
-    try:
-        k = key.char
-    except:  # pylint: disable=bare-except
-        k = key.name
-    if k == "k":
-        asyncio.run_coroutine_threadsafe(send_signals(), loop)
-    elif k == "s":
-        asyncio.run_coroutine_threadsafe(
-            status_input("Enter status (name or value):"), loop
-        )
-    elif k == "t":
-        asyncio.run_coroutine_threadsafe(
-            stone_input("Enter stonetype value (name or value):"), loop
-        )
-
-
-async def main():
-    """Connect to the bridge and start the input Listener."""
-    global loop, listener, finished
-    loop = asyncio.get_running_loop()
-    try:
-        finished = asyncio.Event()
-    except TypeError:
-        gb.log_print("Please update to python 3.10 or newer to use this program")
-        return
-    listener = Listener(on_press=on_press, on_release=on_release)
-    gb.logger.disabled = False
-    print(gravitrax_cli)
-
-    gb.log_print(f"Searching for Bridge")
-    try:
-        if not await b.connect(
-            try_reconnect=True,
-            dc_callback=disconnect_callback,
-        ):
-            return
-
-        gb.log_print(await b.request_battery_string(), bridge=b)
-        await b.notification_enable(notification_callback)
-        await b.request_bridge_info()
-        print(key_info)
-        listener.start()
-        await finished.wait()
-    except asyncio.CancelledError:
-        return
-    finally:
-        listener.stop()
-
-
-if __name__ == "__main__":
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        pass
-    print()
-    gb.log_print("Program finished")
+"""Gravitrax Example Script: Using Keyboard buttons to send signals.
+This script binds the sending of signals to Keyboard Buttons. Received 
+Notifications are displayed.
+The input for the status and stonetype can be done by typing the name of the
+intended Stone or the int value. 
+"""
+
+import asyncio
+import atexit
+import itertools
+import sys
+import time
+
+
+from collections import deque
+from functools import lru_cache
+from threading import Event
+from concurrent.futures import ThreadPoolExecutor
+from pynput.keyboard import Listener, Key, KeyCode
+from gravitraxconnect import gravitrax_bridge as gb
+from gravitraxconnect import gravitrax_constants as gv
+
+# pylint: disable=global-statement
+# pylint: disable=global-variable-not-assigned
+# pylint: disable=invalid-name
+
+try:
+    import termios
+
+    def flush_stdin():
+        """Flush the keyboard buffer before getting input"""
+        termios.tcflush(sys.stdin, termios.TCIOFLUSH)
+
+except ImportError:
+    import msvcrt
+
+    def flush_stdin():
+        """Flush the keyboard buffer before getting input"""
+        while msvcrt.kbhit():
+            msvcrt.getch()
+
+gravitrax_cli = """\
+                                          ><<                                 ><<    ><<       ><<
+                                      ><  ><<                              ><<   ><< ><<       ><<
+   ><<   >< ><<<   ><<    ><<     ><<   ><>< ><>< ><<<   ><<    ><<   ><< ><<        ><<       ><<
+ ><<  ><< ><<    ><<  ><<  ><<   ><< ><<  ><<   ><<    ><<  ><<   >< ><<  ><<        ><<       ><<
+><<   ><< ><<   ><<   ><<   ><< ><<  ><<  ><<   ><<   ><<   ><<    ><     ><<        ><<       ><<
+ ><<  ><< ><<   ><<   ><<    ><><<   ><<  ><<   ><<   ><<   ><<  ><  ><<   ><<   ><< ><<       ><<
+     ><< ><<<     ><< ><<<    ><<    ><<   ><< ><<<     ><< ><<<><<   ><<    ><<<<   ><<<<<<<< ><<
+  ><<                                                                                             \
+"""
+
+key_info = "\
+========================================================\n\
+|   Keys:                                              |\n\
+|   r,g,b:  Send Red/Green/Blue Signal                 |\n\
+|   k:      Send Signals in a fixed interval           |\n\
+|   s:      Change the Status value of send signals    |\n\
+|   t:      Change the stonetype of send signals       |\n\
+|   u:      Send unlock signal                         |\n\
+|   l:      Send lock signal                           |\n\
+|   Esc:    Disconnect and close the program.          |\n\
+|   Ctrl+C: Close the program.                         |\n\
+========================================================"
+
+b = gb.Bridge()
+input_lock = asyncio.Lock()  # Serializes the coroutines that prompt for input
+input_busy = Event()  # Lets the listener thread skip keys while a prompt runs
+finished = None
+loop = None
+listener = None
+
+# Queue for actions triggered by the keyboard listener. The listener thread
+# only appends here and wakes the asyncio loop once per batch instead of
+# scheduling a coroutine for every keypress.
+pending = deque()
+kick = None  # asyncio.Event that is set when new actions are queued
+
+# Signal Parameter
+status = gv.STATUS_ALL
+stone = gv.STONE_BRIDGE
+
+notif_counter = itertools.count(1)  # Numbers the received Notifications
+
+# Single worker thread that runs the blocking input() calls
+input_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asyncinput")
+atexit.register(input_executor.shutdown, wait=False)
+
+
+def print_input_info(name, dictionary: dict):
+    """Prints out the key/value pairs of a dictionary.
+    Used to provide additional information for user inputs.
+    """
+    print("=============================================")
+    print(f"|{name:20} |{'value':20} |")
+    for key, value in dictionary.items():
+        print(f"|{key:20} | {value:20}|")
+    print("=============================================")
+
+
+async def asyncinput(prompt="") -> str:
+    """input that is run asynchronously"""
+    flush_stdin()
+    return (
+        await asyncio.get_running_loop().run_in_executor(input_executor, input, prompt)
+    ).rstrip()
+
+
+def disconnect_callback(bridge: gb.Bridge, **kwargs):
+    """Callback function that is executed when the bridge disconnects"""
+    if kwargs.get("by_timeout"):
+        gb.log_print("Disconnect timed out", bridge=bridge)
+    elif kwargs.get("user_disconnected"):
+        gb.log_print("Successfully Disconnected", bridge=bridge)
+    else:
+        gb.log_print("Connection to Bridge was interrupted", bridge=bridge)
+
+
+def sanitize_input(user_input, cast_to=int, unsigned=True):
+    """Cast a user input into a positive int value."""
+    try:
+        user_input = cast_to(user_input)
+        if unsigned and user_input < 0:
+            raise ValueError("Input of negative number is not allowed")
+        return user_input
+    except (ValueError, TypeError):
+        return None
+
+
+# Accepted spellings for every color, resolved with a single dict lookup
+COLOR_INPUTS = (
+    {name: gv.COLOR_RED for name in ("red", "r", "rot", "1")}
+    | {name: gv.COLOR_GREEN for name in ("green", "g", "grün", "gruen", "2")}
+    | {name: gv.COLOR_BLUE for name in ("blue", "b", "blau", "3")}
+)
+
+
+async def color_input(prompt):
+    """User Input for a color value"""
+    return COLOR_INPUTS.get((await asyncinput(prompt)).lower(), 0)
+
+
+async def stone_input(prompt):
+    """User Input for a stone value"""
+    global stone
+    async with input_lock:
+        input_busy.set()
+        try:
+            print_input_info("Stonetype", gv.DICT_STONE)
+            user_input = (await asyncinput(prompt)).lower()
+            try:
+                stone = gv.DICT_STONE[user_input]
+            except KeyError:
+                if not (stone := sanitize_input(user_input, int)) or stone > 255:
+                    stone = gv.STONE_BRIDGE
+                    gb.log_print("Unknown Stonetype Value")
+            try:
+                gb.log_print(
+                    f"Stonetype switched to {gv.DICT_VAL_STONE[stone]}", bridge=b
+                )
+            except KeyError:
+                gb.log_print(f"Stonetype switched to {stone}", bridge=b)
+        finally:
+            input_busy.clear()
+
+
+async def status_input(prompt):
+    """User input for a status value"""
+    global status
+    async with input_lock:
+        input_busy.set()
+        try:
+            print_input_info("Status", gv.DICT_STATUS)
+            user_input = (await asyncinput(prompt)).upper()
+            try:
+                status = gv.DICT_STATUS[user_input]
+            except KeyError:
+                if not (status := sanitize_input(user_input, int)) or status > 255:
+                    status = gv.STATUS_ALL
+                    gb.log_print("Unknown Status Value")
+            try:
+                gb.log_print(
+                    f"Message Status switched to {gv.DICT_VAL_STATUS[status]}", bridge=b
+                )
+            except KeyError:
+                gb.log_print(f"Message Status switched to {status}", bridge=b)
+        finally:
+            input_busy.clear()
+
+
+async def send_signals():
+    """Get signal information from the user and sends the specified Signals"""
+    global status, stone, finished
+    try:
+        async with input_lock:
+            input_busy.set()
+            try:
+                user_input = await asyncinput("Enter the signal count: ")
+                count = sanitize_input(user_input, int)
+                if count is None:
+                    gb.log_print("Unknown input")
+                    return
+                if not (
+                    color := await color_input("Enter the color of the signal(r,g,b): ")
+                ):
+                    gb.log_print("Unknown input")
+                    return
+                user_input = await asyncinput(
+                    "Enter the time in sec between each signal:"
+                )
+                gap = sanitize_input(user_input, float)
+            finally:
+                input_busy.clear()
+        gb.log_print("Sending Signals")
+        await b.send_periodic(
+            status,
+            color,
+            count=count,
+            stone=stone,
+            gap=gap,
+            resend_gap=0,
+            resends=12,
+        )
+    except asyncio.CancelledError:
+        finished.set()
+        return
+
+
+# Template for the log output of received signals
+SIG_FMT = (
+    "{color:5} detected from Stone {stone} with Status {status}"
+    " ( {n} Notifications received )"
+)
+
+
+@lru_cache(maxsize=256)
+def lookup_status(status):
+    """Resolve a status value to its name"""
+    return gv.DICT_VAL_STATUS.get(status, status)
+
+
+@lru_cache(maxsize=256)
+def lookup_stone(stone):
+    """Resolve a stone value to its name"""
+    return gv.DICT_VAL_STONE.get(stone, stone)
+
+
+@lru_cache(maxsize=256)
+def lookup_color(color):
+    """Resolve a color value to its name"""
+    try:
+        return gv.LOOKUP_COLOR[color]
+    except (IndexError, TypeError):
+        return f"Color{color}"
+
+
+async def notification_callback(bridge: gb.Bridge, **signal):
+    """Callback function that is executed when a notification is received"""
+    count = next(notif_counter)
+    if signal.get("Header"):  # Check if Notification was a signal
+        sig_status = lookup_status(signal.get("Status"))
+        sig_stone = lookup_stone(signal.get("Stone"))
+        sig_color = lookup_color(signal.get("Color"))
+
+        gb.log_print(
+            SIG_FMT.format(
+                color=sig_color, stone=sig_stone, status=sig_status, n=count
+            ),
+            bridge=bridge,
+        )
+    else:
+        gb.log_print(f"New Notification: {signal.get('Data')}", bridge=bridge)
+
+
+# Table mapping the queued action keys to the coroutine that should run.
+# The values are zero-argument callables so the current status/stone
+# globals are picked up when the action is executed.
+ACTIONS = {
+    "r": lambda: b.send_signal(status, gv.COLOR_RED, stone=stone),
+    "g": lambda: b.send_signal(status, gv.COLOR_GREEN, stone=stone),
+    "b": lambda: b.send_signal(status, gv.COLOR_BLUE, stone=stone),
+    "u": lambda: b.send_signal(gv.STATUS_UNLOCK, gv.COLOR_RED),
+    "l": lambda: b.send_signal(gv.STATUS_LOCK, gv.COLOR_RED),
+    "k": lambda: send_signals(),
+    "s": lambda: status_input("Enter status (name or value):"),
+    "t": lambda: stone_input("Enter stonetype value (name or value):"),
+}
+
+# Key objects hash and compare by character, so the listener callbacks can
+# resolve a key with a single dict lookup instead of probing key.char and
+# key.name for every event.
+PRESS_TABLE = {KeyCode.from_char(c): c for c in ("r", "g", "b", "u", "l")}
+RELEASE_TABLE = {KeyCode.from_char(c): c for c in ("k", "s", "t")}
+
+# Minimum time in seconds between two queued signals of the same color.
+# Keeps key-repeat from a held button from flooding the queue. No lock is
+# needed because pynput delivers the key events one after another.
+SIGNAL_KEY_GAP = 0.02
+last_sent = {"r": 0.0, "g": 0.0, "b": 0.0}
+
+
+def enqueue_action(action):
+    """Queue an action from the listener thread and wake up the asyncio loop.
+
+    The loop is only woken for the entry that made the queue non-empty.
+    For every other entry the already scheduled wakeup drains the whole
+    queue. The append happens before the emptiness check, so the pump can
+    never drain to empty in between and miss the new entry.
+    """
+    pending.append(action)
+    if len(pending) == 1:
+        loop.call_soon_threadsafe(kick.set)
+
+
+async def action_pump():
+    """Work off the actions queued by the keyboard listener"""
+    while True:
+        await kick.wait()
+        kick.clear()
+        while pending:
+            await ACTIONS[pending.popleft()]()
+
+
+def on_press(key):
+    """Handling of keyboard presses"""
+    global b, finished, listener, loop
+
+    if key == Key.esc:
+        loop.call_soon_threadsafe(finished.set)
+        listener.stop()
+    elif input_busy.is_set():
+        return
+    if action := PRESS_TABLE.get(key):
+        if action in last_sent:
+            now = time.monotonic()
+            if now - last_sent[action] < SIGNAL_KEY_GAP:
+                return
+            last_sent[action] = now
+        enqueue_action(action)
+
+
+def on_release(key):
+    """handling of keyboard releases"""
+    if input_busy.is_set():
+        return
+    if action := RELEASE_TABLE.get(key):
+        enqueue_action(action)
+
+
+async def main():
+    """Connect to the bridge and start the input Listener."""
+    global loop, listener, finished, kick
+    loop = asyncio.get_running_loop()
+    try:
+        finished = asyncio.Event()
+        kick = asyncio.Event()
+    except TypeError:
+        gb.log_print("Please update to python 3.10 or newer to use this program")
+        return
+    listener = Listener(on_press=on_press, on_release=on_release)
+    gb.logger.disabled = False
+    if sys.stdout.isatty():
+        print(gravitrax_cli)
+
+    gb.log_print(f"Searching for Bridge")
+    connected = False
+    try:
+        if not await b.connect(
+            try_reconnect=True,
+            dc_callback=disconnect_callback,
+        ):
+            return
+        connected = True
+
+        gb.log_print(await b.request_battery_string(), bridge=b)
+        await b.notification_enable(notification_callback)
+        await b.request_bridge_info()
+        print(key_info)
+        pump_task = loop.create_task(action_pump())
+        listener.start()
+        await finished.wait()
+        pump_task.cancel()
+    except asyncio.CancelledError:
+        return
+    finally:
+        listener.stop()
+        if connected:
+            await b.disconnect(timeout=15, dc_callback_on_timeout=True)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    print()
+    gb.log_print("Program finished")
@@ -1354,7 +1354,9 @@ def main():
 
 if __name__ == "__main__":
     # Thread to run Asyncio corutines for bluetooth communication
-    Thread(target=asyncio.run, args=[asyncthread()]).start()
+    # Pass a factory so the coroutine object is created in the new
+    # thread instead of eagerly here; daemon so teardown cannot hang
+    Thread(target=lambda: asyncio.run(asyncthread()), daemon=True).start()
     # Thread to work off the queued commands from the GUI
     Thread(target=gui_worker_thread).start()
     main()  # initialize and run the GUI
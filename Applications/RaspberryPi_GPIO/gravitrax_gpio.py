@@ -1,158 +1,195 @@
-"""Gravitrax Example Script: 
-This script uses the GPIO Pins of a Raspberry Pi. For every Color(R,G,B)
-there is a Input as well as an output pin.  
-If a input pin is set to high a signal with the corresponding color
-is send. The output pins are set to the last send or received signal.
-"""
-
-import asyncio
-import sys
-
-from gravitraxconnect import gravitrax_bridge as gb
-from gravitraxconnect import gravitrax_constants as gv
-
-# pylint: disable=global-statement
-# pylint: disable=global-variable-not-assigned
-# pylint: disable=invalid-name
-
-try:
-    import RPi.GPIO as GPIO
-except ImportError:
-    sys.exit("Program finished: Module RPi.GPIO not found")
-
-b = gb.Bridge()
-loop = None
-name = gv.BRIDGE_NAME
-notif_counter = 0
-
-
-# Output Pins
-pin_out_red = 22
-pin_out_green = 27
-pin_out_blue = 17
-
-# Input Pins
-pin_in_red = 13
-pin_in_green = 6
-pin_in_blue = 5
-
-
-def disconnect_callback(bridge: gb.Bridge, **kwargs):
-    """Callback for disconnects"""
-    gb.log_print("Bridge was disconnected", bridge=bridge)
-
-
-def setOutput(color):
-    """Sets one of the 3 outputs to high the others to low.
-
-    Args:
-        - color: int value for red(1), green(2) or blue(3)
-    """
-    for i, channel in enumerate([pin_out_red, pin_out_green, pin_out_blue]):
-        if i + 1 == color:
-            GPIO.output(channel, True)
-        else:
-            GPIO.output(channel, False)
-
-
-def gpio_callback(channel):
-    """Executed when one of the input pins is connected to ground.
-    Args:
-        - channel: Number of the detected pin
-    """
-    global loop
-    try:
-        color = [pin_in_red, pin_in_green, pin_in_blue].index(channel) + 1
-        setOutput(color)
-    except ValueError:
-        return
-
-    asyncio.run_coroutine_threadsafe(
-        b.send_signal(gv.STATUS_ALL, color, stone=gv.STONE_BRIDGE), loop
-    )
-
-
-async def notification_callback(bridge: gb.Bridge, **signal):
-    """Callback function for received Notifications
-
-    When a signal is received the output is set to the color
-    of the received signal.
-
-    """
-    global notif_counter
-
-    def lookup(value, table):
-        try:
-            return table[value]
-        except (IndexError, KeyError):
-            return value
-
-    notif_counter += 1
-    color_int = signal.get("Color")
-
-    try:
-        setOutput([gv.COLOR_RED, gv.COLOR_GREEN, gv.COLOR_BLUE].index(color_int) + 1)
-    except ValueError:
-        return
-
-    stone = lookup(signal.get("Stone"), gv.DICT_VAL_STONE)
-    color = lookup(color_int, gv.LOOKUP_COLOR)
-    gb.log_print(
-        f"{color:5} detected ",
-        f"from Stone {stone:10}",
-        f"( {notif_counter} Notifications received )",
-        bridge=bridge,
-    )
-
-async def main():
-    """Enable GPIo Pins and attach """
-    global loop
-    loop = asyncio.get_running_loop()
-    gb.logger.disabled = False
-
-    GPIO.setmode(GPIO.BCM)
-
-    # Output Pins
-    GPIO.setup(pin_out_red, GPIO.OUT)
-    GPIO.setup(pin_out_green, GPIO.OUT)
-    GPIO.setup(pin_out_blue, GPIO.OUT)
-
-    # Input Pins
-    GPIO.setup(pin_in_red, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-    GPIO.setup(pin_in_green, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-    GPIO.setup(pin_in_blue, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-
-    # Set Callback for input Pins
-    GPIO.add_event_detect(
-        pin_in_red, GPIO.FALLING, callback=gpio_callback, bouncetime=150
-    )
-    GPIO.add_event_detect(
-        pin_in_green, GPIO.FALLING, callback=gpio_callback, bouncetime=150
-    )
-    GPIO.add_event_detect(
-        pin_in_blue, GPIO.FALLING, callback=gpio_callback, bouncetime=150
-    )
-
-    gb.log_print(f"Looking for connection: {name}")
-    try:
-        if await b.connect(name, dc_callback=disconnect_callback, try_reconnect=True):
-            await b.notification_enable(notification_callback)
-        else:
-            gb.log_print(f"Could not connect to Device with Name: {name}")
-            return
-
-        await asyncio.Event().wait()
-    except asyncio.CancelledError:
-        return
-
-
-if __name__ == "__main__":
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        pass
-    finally:
-        GPIO.cleanup()
-
-    gb.log_print("Program finished")
+"""Gravitrax Example Script: 
+This script uses the GPIO Pins of a Raspberry Pi. For every Color(R,G,B)
+there is a Input as well as an output pin.  
+If a input pin is set to high a signal with the corresponding color
+is send. The output pins are set to the last send or received signal.
+"""
+
+import asyncio
+import sys
+
+from gravitraxconnect import gravitrax_bridge as gb
+from gravitraxconnect import gravitrax_constants as gv
+
+# pylint: disable=global-statement
+# pylint: disable=global-variable-not-assigned
+# pylint: disable=invalid-name
+
+try:
+    import RPi.GPIO as GPIO
+except ImportError:
+    sys.exit("Program finished: Module RPi.GPIO not found")
+
+b = gb.Bridge()
+loop = None
+name = gv.BRIDGE_NAME
+notif_counter = 0
+stop_future = None  # Resolved when the user disconnects the Bridge
+
+# Bursty signals are coalesced: a notification only reaches the pins and
+# the log when no newer one arrives within this window (seconds)
+COALESCE_WINDOW = 0.02
+_flush_handle = None  # Timer handle of the pending flush
+
+
+# Output Pins
+pin_out_red = 22
+pin_out_green = 27
+pin_out_blue = 17
+
+# Input Pins
+pin_in_red = 13
+pin_in_green = 6
+pin_in_blue = 5
+
+# Lookup tables for the hot callback paths. Dict hits replace building a
+# fresh list and scanning it with index() on every edge or notification.
+_OUT_PINS = (pin_out_red, pin_out_green, pin_out_blue)
+_PIN_TO_COLOR = {pin_in_red: 1, pin_in_green: 2, pin_in_blue: 3}
+_COLOR_TO_OUT = {1: pin_out_red, 2: pin_out_green, 3: pin_out_blue}
+_NOTIF_COLOR_IDX = {gv.COLOR_RED: 1, gv.COLOR_GREEN: 2, gv.COLOR_BLUE: 3}
+
+
+def disconnect_callback(bridge: gb.Bridge, **kwargs):
+    """Callback for disconnects"""
+    gb.log_print("Bridge was disconnected", bridge=bridge)
+    if kwargs.get("user_disconnected") and stop_future and not stop_future.done():
+        loop.call_soon_threadsafe(stop_future.set_result, None)
+
+
+def setOutput(color):
+    """Sets one of the 3 outputs to high the others to low.
+
+    Args:
+        - color: int value for red(1), green(2) or blue(3)
+    """
+    GPIO.output(_OUT_PINS, (color == 1, color == 2, color == 3))
+
+
+def gpio_callback(
+    channel,
+    _pin_colors=_PIN_TO_COLOR,
+    _bridge=b,
+    _status=gv.STATUS_ALL,
+    _stone=gv.STONE_BRIDGE,
+):
+    """Executed when one of the input pins is connected to ground.
+    Args:
+        - channel: Number of the detected pin
+
+    The constants are bound as default arguments so the edge handler
+    only uses local variables.
+    """
+    global loop
+    color = _pin_colors.get(channel)
+    if color is None:
+        return
+    setOutput(color)
+
+    # Nothing waits for the result, so call_soon_threadsafe is enough and
+    # skips the Future bookkeeping of run_coroutine_threadsafe
+    loop.call_soon_threadsafe(
+        loop.create_task, _bridge.send_signal(_status, color, stone=_stone)
+    )
+
+
+def _flush_notification(
+    idx, color_int, stone_raw, _stone_t=gv.DICT_VAL_STONE, _color_t=gv.LOOKUP_COLOR
+):
+    """Write the latest coalesced notification to the pins and the log"""
+    global _flush_handle
+    _flush_handle = None
+    setOutput(idx)
+    stone = lookup(stone_raw, _stone_t)
+    color = lookup(color_int, _color_t)
+    gb.log_print(
+        f"{color:5} detected ",
+        f"from Stone {stone:10}",
+        f"( {notif_counter} Notifications received )",
+        bridge=b,
+    )
+
+
+def lookup(value, table):
+    """Return the name of a signal value or the value itself when unknown"""
+    try:
+        return table[value]
+    except (IndexError, KeyError):
+        return value
+
+
+async def notification_callback(bridge: gb.Bridge, **signal):
+    """Callback function for received Notifications
+
+    Received signals are counted immediately but the pin update and the
+    log line are deferred by COALESCE_WINDOW, so a resend burst causes
+    one GPIO write and one log entry instead of one per notification.
+    """
+    global notif_counter, _flush_handle
+
+    notif_counter += 1
+    color_int = signal.get("Color")
+
+    idx = _NOTIF_COLOR_IDX.get(color_int)
+    if idx is None:
+        return
+
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+    _flush_handle = loop.call_later(
+        COALESCE_WINDOW, _flush_notification, idx, color_int, signal.get("Stone")
+    )
+
+async def main():
+    """Enable GPIo Pins and attach """
+    global loop, stop_future
+    loop = asyncio.get_running_loop()
+    stop_future = loop.create_future()
+    gb.logger.disabled = False
+
+    GPIO.setmode(GPIO.BCM)
+
+    # Output Pins
+    GPIO.setup(pin_out_red, GPIO.OUT)
+    GPIO.setup(pin_out_green, GPIO.OUT)
+    GPIO.setup(pin_out_blue, GPIO.OUT)
+
+    # Input Pins
+    GPIO.setup(pin_in_red, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+    GPIO.setup(pin_in_green, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+    GPIO.setup(pin_in_blue, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+
+    # Set Callback for input Pins
+    GPIO.add_event_detect(
+        pin_in_red, GPIO.FALLING, callback=gpio_callback, bouncetime=150
+    )
+    GPIO.add_event_detect(
+        pin_in_green, GPIO.FALLING, callback=gpio_callback, bouncetime=150
+    )
+    GPIO.add_event_detect(
+        pin_in_blue, GPIO.FALLING, callback=gpio_callback, bouncetime=150
+    )
+
+    gb.log_print(f"Looking for connection: {name}")
+    try:
+        if await b.connect(name, dc_callback=disconnect_callback, try_reconnect=True):
+            await b.notification_enable(notification_callback)
+        else:
+            gb.log_print(f"Could not connect to Device with Name: {name}")
+            return
+
+        await stop_future
+    except asyncio.CancelledError:
+        return
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        GPIO.cleanup()
+
+    gb.log_print("Program finished")
     
\ No newline at end of file
@@ -1,205 +1,252 @@
-"""Gravitrax Reaction Game: 
-A command line Reaction game that uses gravitrax power stones.
-Needed Stones:
-- 2 Levers
-- 1 Starter
-- 2 Trigger
-- 2 Finishes
-- 3 Switches
-
-The game generates a sequence of colors. The player can use Switches 
-to direct the automatically released marbles through the correct 
-Finishes and Triggers.
-"""
-
-# pylint: disable=global-statement
-# pylint: disable=global-variable-not-assigned
-# pylint: disable=invalid-name
-
-import asyncio
-import random
-import colorama
-
-from termcolor import colored
-from pynput.keyboard import Listener, Key
-from gravitraxconnect import gravitrax_bridge as gb
-from gravitraxconnect import gravitrax_constants as gv
-
-try:
-    import winsound
-
-    playsound = True
-except ImportError:
-    print("Module Winsounds not found. No sounds are played")
-    playsound = False
-
-b = gb.Bridge()
-colors = ["red", "green", "blue"]
-loop = None
-listener = None
-
-# Game state
-difficulty = 0
-score = 0
-sequence = []
-fin_count = 0
-finished = None
-disconnected = False
-
-
-async def shutdown():
-    """Shutdown the main Thread of the Script"""
-    finished.set()
-
-
-def disconnect_callback(bridge: gb.Bridge, **kwargs):
-    """Callback for disconnects"""
-    if kwargs.get("user_disconnected"):
-        finished.set()
-
-
-async def notification_callback(bridge: gb.Bridge, **signal):
-    """callback for received Signals"""
-    global score, colors, fin_count, playsound
-    stonetype = signal.get("Stone")
-    color = signal.get("Color")
-    if stonetype == gv.STONE_TRIGGER or stonetype == gv.STONE_FINISH:
-        if len(sequence) == 0:  # Do nothing when no game is played
-            return
-        if color != gv.COLOR_BLUE:  # When a marble finishes
-            fin_count += 1
-            if difficulty == 1:
-                # Release the next marble
-                await bridge.send_signal(gv.STATUS_STARTER, gv.COLOR_RED)
-            if color == sequence[0]:
-                score += 1
-        if color != sequence[0]:
-            score -= 1
-            print(f"Wrong! Next Colors: ", end="")
-            if playsound:
-                winsound.PlaySound(
-                    "WQ.FX.Wrong.wav", winsound.SND_ASYNC | winsound.SND_ALIAS
-                )
-        else:
-            print("Correct! Next Colors: ", end="")
-            if playsound:
-                winsound.PlaySound(
-                    "WQ.FX.GameStart.wav", winsound.SND_ASYNC | winsound.SND_ALIAS
-                )
-
-        sequence.pop(0)
-        if fin_count < 7:
-            for _,color in enumerate(sequence):
-                print(
-                    colored(f"{colors[color-1]} ", colors[color - 1]),
-                    end="",
-                )
-                if color != 3:
-                    break
-            print()
-        else:  # All Marbles used
-            print()
-            print(f"All Marbles used: {score} Points scored")
-            print("Press Level Button to play again")
-
-
-def on_press(key):
-    """ Evaluation of Button presses"""
-    global b, finished, difficulty, listener, loop
-    if difficulty == 1:
-        status = gv.STATUS_ALL
-    else:
-        status = gv.STATUS_SWITCH
-    if key == Key.f1:
-        asyncio.run_coroutine_threadsafe(b.send_signal(status, gv.COLOR_RED), loop)
-    elif key == Key.f2:
-        asyncio.run_coroutine_threadsafe(b.send_signal(status, gv.COLOR_GREEN), loop)
-    elif key == Key.f3:
-        asyncio.run_coroutine_threadsafe(b.send_signal(status, gv.COLOR_BLUE), loop)
-    elif key == Key.f4:
-        difficulty = 0
-        level()
-    elif key == Key.f5:
-        difficulty = 1
-        level()
-    elif key == Key.f6:
-        difficulty = 2
-        level()
-    elif key == Key.f7:
-        if difficulty == 0:
-            asyncio.run_coroutine_threadsafe(release_timed(10), loop)
-        else:
-            asyncio.run_coroutine_threadsafe(
-                b.send_signal(gv.STATUS_STARTER, gv.COLOR_RED), loop
-            )
-    elif key == Key.esc:
-        gb.log_print(f"Stop Signal received: Closing Program")
-        asyncio.run_coroutine_threadsafe(
-            b.disconnect(timeout=15, dc_callback_on_timeout=True), loop
-        )
-        listener.stop()
-
-
-def level():
-    """Start new level and generate random color sequence"""
-    global score, fin_count
-    sequence.clear()
-    score = 0
-    fin_count = 0
-    print("Level started. Press F7 ro release the first marble")
-    print("The Color sequence is:")
-    for _ in range(7):
-        color = random.randrange(1, 4)
-        sequence.append(color)
-        if sequence[-1] == 3:
-            sequence.append(random.randrange(1, 4))
-            if sequence[-1] == 3:
-                sequence.append(random.randrange(1, 3))
-    for color in sequence:
-        print(colored(f"{colors[color-1]} ", colors[color - 1]), end="")
-    print()
-
-
-async def release_timed(delay):
-    """Release 7 marbles with a timegap inbetween"""
-    try:
-        for _ in range(7):
-            await b.send_signal(gv.STATUS_STARTER, gv.COLOR_RED)
-            await asyncio.sleep(delay)
-    except asyncio.CancelledError:
-        return
-
-async def main():
-    """Start the keyboard listener and connect to the bridge"""
-    global finished, loop, listener
-    loop = asyncio.get_running_loop()
-    try:
-        finished = asyncio.Event()
-    except TypeError:
-        gb.log_print("Please update to python 3.10 or newer to use this program")
-        return
-    listener = Listener(on_press=on_press)
-    colorama.init()
-
-    gb.logger.disabled = False
-    gb.log_print(f"Searching for Bridge")
-    try:
-        if await b.connect(try_reconnect=True, dc_callback=disconnect_callback):
-            await b.start_bridge_mode()
-            await b.notification_enable(notification_callback)
-            gb.log_print("Start Level with F4=hard, F5=very hard, F6=impossible")
-            listener.start()
-        else:
-            gb.log_print(f"Could not find Bridge to connect to")
-
-        await finished.wait()
-    except asyncio.CancelledError:
-        return
-
-
-if __name__ == "__main__":
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        pass
-    gb.log_print("Program finished")
+"""Gravitrax Reaction Game: 
+A command line Reaction game that uses gravitrax power stones.
+Needed Stones:
+- 2 Levers
+- 1 Starter
+- 2 Trigger
+- 2 Finishes
+- 3 Switches
+
+The game generates a sequence of colors. The player can use Switches 
+to direct the automatically released marbles through the correct 
+Finishes and Triggers.
+"""
+
+# pylint: disable=global-statement
+# pylint: disable=global-variable-not-assigned
+# pylint: disable=invalid-name
+
+import asyncio
+import random
+import colorama
+
+from collections import deque
+
+from termcolor import colored
+from pynput.keyboard import Listener, Key
+from gravitraxconnect import gravitrax_bridge as gb
+from gravitraxconnect import gravitrax_constants as gv
+
+try:
+    import winsound
+
+    playsound = True
+except ImportError:
+    print("Module Winsounds not found. No sounds are played")
+    playsound = False
+
+# Read the sound files once so playback does not reopen them on every hit
+if playsound:
+    try:
+        with open("WQ.FX.Wrong.wav", "rb") as file:
+            WRONG_SOUND = file.read()
+        with open("WQ.FX.GameStart.wav", "rb") as file:
+            CORRECT_SOUND = file.read()
+    except OSError:
+        print("Sound files not found. No sounds are played")
+        playsound = False
+
+b = gb.Bridge()
+colors = ["red", "green", "blue"]
+key_queue = None  # asyncio.Queue feeding Keypresses to key_consumer
+# ANSI color tokens built once instead of through colored() on every print
+COLORED_TOKENS = tuple(colored(f"{name} ", name) for name in colors)
+loop = None
+listener = None
+
+# Game state
+difficulty = 0
+score = 0
+sequence = deque()
+fin_count = 0
+finished = None
+disconnected = False
+cancel_release = None  # Event that interrupts a running release_timed
+
+
+async def shutdown():
+    """Shutdown the main Thread of the Script"""
+    finished.set()
+
+
+def disconnect_callback(bridge: gb.Bridge, **kwargs):
+    """Callback for disconnects"""
+    if kwargs.get("user_disconnected"):
+        finished.set()
+
+
+async def notification_callback(
+    bridge: gb.Bridge,
+    *,
+    _stone_trigger=gv.STONE_TRIGGER,
+    _stone_finish=gv.STONE_FINISH,
+    _color_blue=gv.COLOR_BLUE,
+    _status_starter=gv.STATUS_STARTER,
+    _color_red=gv.COLOR_RED,
+    **signal,
+):
+    """callback for received Signals
+
+    The signal constants are bound as default arguments so the hot path
+    only uses local variables.
+    """
+    global score, colors, fin_count, playsound
+    stonetype = signal.get("Stone")
+    color = signal.get("Color")
+    if stonetype == _stone_trigger or stonetype == _stone_finish:
+        if len(sequence) == 0:  # Do nothing when no game is played
+            return
+        if color != _color_blue:  # When a marble finishes
+            fin_count += 1
+            if difficulty == 1:
+                # Release the next marble
+                await bridge.send_signal(_status_starter, _color_red)
+            if color == sequence[0]:
+                score += 1
+        if color != sequence[0]:
+            score -= 1
+            print(f"Wrong! Next Colors: ", end="")
+            if playsound:
+                loop.run_in_executor(
+                    None,
+                    winsound.PlaySound,
+                    WRONG_SOUND,
+                    winsound.SND_MEMORY,
+                )
+        else:
+            print("Correct! Next Colors: ", end="")
+            if playsound:
+                loop.run_in_executor(
+                    None,
+                    winsound.PlaySound,
+                    CORRECT_SOUND,
+                    winsound.SND_MEMORY,
+                )
+
+        sequence.popleft()
+        if fin_count < 7:
+            for color in sequence:
+                print(COLORED_TOKENS[color - 1], end="")
+                if color != 3:
+                    break
+            print()
+        else:  # All Marbles used
+            print()
+            print(f"All Marbles used: {score} Points scored")
+            print("Press Level Button to play again")
+
+
+# Dispatch tables for the keyboard listener. The hot color keys resolve
+# with one dict hit instead of walking an if-chain on every press.
+KEY_COLORS = {Key.f1: gv.COLOR_RED, Key.f2: gv.COLOR_GREEN, Key.f3: gv.COLOR_BLUE}
+KEY_LEVELS = {Key.f4: 0, Key.f5: 1, Key.f6: 2}
+
+
+def on_press(key):
+    """Forward Keypresses to the asyncio loop
+    Runs in the listener thread and only posts the key, so the thread
+    returns immediately without any Future bookkeeping.
+    """
+    loop.call_soon_threadsafe(key_queue.put_nowait, key)
+
+
+async def key_consumer():
+    """ Evaluation of Button presses from the key queue"""
+    global b, finished, difficulty, listener
+    while True:
+        key = await key_queue.get()
+        if (color := KEY_COLORS.get(key)) is not None:
+            status = gv.STATUS_ALL if difficulty == 1 else gv.STATUS_SWITCH
+            await b.send_signal(status, color)
+        elif (new_difficulty := KEY_LEVELS.get(key)) is not None:
+            difficulty = new_difficulty
+            level()
+        elif key == Key.f7:
+            if difficulty == 0:
+                asyncio.create_task(release_timed(10))
+            else:
+                await b.send_signal(gv.STATUS_STARTER, gv.COLOR_RED)
+        elif key == Key.esc:
+            gb.log_print(f"Stop Signal received: Closing Program")
+            listener.stop()
+            await b.disconnect(timeout=15, dc_callback_on_timeout=True)
+            return
+
+
+def level():
+    """Start new level and generate random color sequence"""
+    global score, fin_count
+    cancel_release.set()  # Stop marbles still in flight from the last level
+    cancel_release.clear()
+    sequence.clear()
+    score = 0
+    fin_count = 0
+    print("Level started. Press F7 ro release the first marble")
+    print("The Color sequence is:")
+    # One choices() call draws the base sequence; blue entries roll
+    # their follow-up marble while extending
+    for color in random.choices((1, 2, 3), k=7):
+        sequence.append(color)
+        if color == 3:
+            extra = random.randrange(1, 4)
+            sequence.append(extra)
+            if extra == 3:
+                sequence.append(random.randrange(1, 3))
+    for color in sequence:
+        print(COLORED_TOKENS[color - 1], end="")
+    print()
+
+
+async def release_timed(delay):
+    """Release 7 marbles with a timegap inbetween
+    The pause waits on the cancel event, so starting a new level stops
+    the remaining releases instead of letting them tick on.
+    """
+    try:
+        for _ in range(7):
+            await b.send_signal(gv.STATUS_STARTER, gv.COLOR_RED)
+            try:
+                await asyncio.wait_for(cancel_release.wait(), timeout=delay)
+                return
+            except asyncio.TimeoutError:
+                pass
+    except asyncio.CancelledError:
+        return
+
+async def main():
+    """Start the keyboard listener and connect to the bridge"""
+    global finished, loop, listener, key_queue, cancel_release
+    loop = asyncio.get_running_loop()
+    key_queue = asyncio.Queue()
+    cancel_release = asyncio.Event()
+    try:
+        finished = asyncio.Event()
+    except TypeError:
+        gb.log_print("Please update to python 3.10 or newer to use this program")
+        return
+    listener = Listener(on_press=on_press)
+    colorama.init()
+
+    gb.logger.disabled = False
+    gb.log_print(f"Searching for Bridge")
+    try:
+        if await b.connect(try_reconnect=True, dc_callback=disconnect_callback):
+            await b.start_bridge_mode()
+            await b.notification_enable(notification_callback)
+            gb.log_print("Start Level with F4=hard, F5=very hard, F6=impossible")
+            asyncio.create_task(key_consumer())
+            listener.start()
+        else:
+            gb.log_print(f"Could not find Bridge to connect to")
+
+        await finished.wait()
+    except asyncio.CancelledError:
+        return
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    gb.log_print("Program finished")
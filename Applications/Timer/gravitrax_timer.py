@@ -1,91 +1,117 @@
-"""Gravitrax Example Script: 
-Using a Thread to receive Keyboard inputs while using the Gravitrax Library . 
-- Send Signal with Keyboard inputs
-- React to Notifications in different ways depending on the stonetype and color
-"""
-
-import asyncio
-import time
-
-from pynput.keyboard import Listener, Key
-from gravitraxconnect import gravitrax_bridge as gb
-from gravitraxconnect import gravitrax_constants as gv
-
-
-# pylint: disable=global-statement
-# pylint: disable=global-variable-not-assigned
-# pylint: disable=invalid-name
-
-b = gb.Bridge()
-loop = None
-listener = None
-
-START_COLOR = gv.COLOR_BLUE
-FIN_COLOR = gv.COLOR_GREEN
-
-start_times = []
-disconnected = False
-finished = None
-
-
-def disconnect_callback(bridge: gb.Bridge, **kwargs):
-    """Callback for disconnects"""
-    if kwargs.get("user_disconnected"):
-        finished.set()
-
-
-async def notification_callback(bridge: gb.Bridge, **signal):
-    """callback for incomming Signals"""
-    global FIN_COLOR, START_COLOR, start_times
-    if signal.get("Header"):  # Check if Notification was a signal
-        status = signal.get("Status")
-        stone = signal.get("Stone")
-        color = signal.get("Color")
-        if color == START_COLOR or status == gv.STATUS_STARTER_PRESS:
-            start_times.append(time.time())
-        if stone == gv.STONE_FINISH and color == FIN_COLOR:
-            if start_times:
-                gb.log_print(
-                    f"Time between Start and Finish {time.time()-start_times.pop(0)}"
-                )
-
-
-def on_press(key):
-    """Evaluation of Keypresses"""
-    global b, START_COLOR, disconnected
-    if key == Key.f1:
-        asyncio.run_coroutine_threadsafe(
-            b.send_signal(gv.STATUS_STARTER, START_COLOR, stone=gv.STONE_REMOTE), loop
-        )
-    if key == Key.esc:
-        gb.log_print(f"Stop Signal received: Disconnecting Bridge", bridge=b)
-        asyncio.run_coroutine_threadsafe(b.disconnect(), loop)
-        listener.stop()
-
-
-async def main():
-    """Connect to the Bridge and start the keyboard input listener"""
-    global finished, loop, listener
-    loop = asyncio.get_running_loop()
-    try:
-        finished = asyncio.Event()
-    except TypeError:
-        gb.log_print("Please update to python 3.10 or newer to use this program")
-        return
-    listener = Listener(on_press=on_press)
-    gb.logger.disabled = False
-    gb.log_print(f"Searching for Bridge")
-    if await b.connect(try_reconnect=True, dc_callback=disconnect_callback):
-        gb.log_print(await b.request_battery_string(), bridge=b)
-        await b.notification_enable(notification_callback)
-        listener.start()
-    else:
-        gb.log_print(f"Could find Bridge to connect to")
-    await finished.wait()
-
-
-if __name__ == "__main__":
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        gb.log_print("Program finished")
+"""Gravitrax Example Script: 
+Using a Thread to receive Keyboard inputs while using the Gravitrax Library . 
+- Send Signal with Keyboard inputs
+- React to Notifications in different ways depending on the stonetype and color
+"""
+
+import asyncio
+import logging
+import time
+
+from collections import deque
+from pynput.keyboard import Listener, Key
+from gravitraxconnect import gravitrax_bridge as gb
+from gravitraxconnect import gravitrax_constants as gv
+
+
+# pylint: disable=global-statement
+# pylint: disable=global-variable-not-assigned
+# pylint: disable=invalid-name
+
+b = gb.Bridge()
+loop = None
+listener = None
+key_queue = None  # asyncio.Queue feeding Keypresses to key_consumer
+
+START_COLOR = gv.COLOR_BLUE
+FIN_COLOR = gv.COLOR_GREEN
+
+# Bounded so unmatched start signals cannot grow without limit; on
+# overflow the oldest stamp is dropped
+start_times = deque(maxlen=256)
+disconnected = False
+finished = None
+
+
+def disconnect_callback(bridge: gb.Bridge, **kwargs):
+    """Callback for disconnects"""
+    if kwargs.get("user_disconnected"):
+        finished.set()
+
+
+async def notification_callback(
+    bridge: gb.Bridge,
+    *,
+    _starter_press=gv.STATUS_STARTER_PRESS,
+    _stone_finish=gv.STONE_FINISH,
+    **signal,
+):
+    """callback for incomming Signals
+
+    The signal constants are bound as default arguments so the hot path
+    only uses local variables.
+    """
+    global FIN_COLOR, START_COLOR, start_times
+    if signal.get("Header"):  # Check if Notification was a signal
+        status = signal.get("Status")
+        stone = signal.get("Stone")
+        color = signal.get("Color")
+        if color == START_COLOR or status == _starter_press:
+            start_times.append(time.perf_counter())
+        if stone == _stone_finish and color == FIN_COLOR:
+            if start_times:
+                diff = time.perf_counter() - start_times.popleft()
+                if not gb.logger.disabled and gb.logger.isEnabledFor(logging.INFO):
+                    gb.log_print(f"Time between Start and Finish {diff}")
+
+
+def on_press(key):
+    """Forward Keypresses to the asyncio loop
+    Runs in the listener thread and only posts the key, so the thread
+    returns immediately without any Future bookkeeping.
+    """
+    loop.call_soon_threadsafe(key_queue.put_nowait, key)
+
+
+async def key_consumer(_send_key=Key.f1, _stop_key=Key.esc):
+    """Evaluation of Keypresses from the key queue"""
+    global b, START_COLOR
+    while True:
+        key = await key_queue.get()
+        if key == _send_key:
+            await b.send_signal(gv.STATUS_STARTER, START_COLOR, stone=gv.STONE_REMOTE)
+        elif key == _stop_key:
+            gb.log_print(f"Stop Signal received: Disconnecting Bridge", bridge=b)
+            listener.stop()
+            await b.disconnect()
+            return
+
+
+async def main():
+    """Connect to the Bridge and start the keyboard input listener"""
+    global finished, loop, listener, key_queue
+    loop = asyncio.get_running_loop()
+    key_queue = asyncio.Queue()
+    try:
+        finished = asyncio.Event()
+    except TypeError:
+        gb.log_print("Please update to python 3.10 or newer to use this program")
+        return
+    listener = Listener(on_press=on_press)
+    gb.logger.disabled = False
+    gb.log_print(f"Searching for Bridge")
+    if await b.connect(try_reconnect=True, dc_callback=disconnect_callback):
+        gb.log_print(await b.request_battery_string(), bridge=b)
+        await b.notification_enable(notification_callback)
+        asyncio.create_task(key_consumer())
+        listener.start()
+    else:
+        gb.log_print(f"Could find Bridge to connect to")
+    await finished.wait()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        gb.log_print("Program finished")
@@ -6,28 +6,30 @@ The group with id=1 prints an output when receiving a blue signal
 """
 
 import asyncio
+import logging
 
 from gravitraxconnect import gravitrax_bridge as gb
 from gravitraxconnect import gravitrax_constants
 
+# Color names keyed by value so unknown colors fall back without an
+# exception on the notification path
+COLOR_TABLE = dict(enumerate(gravitrax_constants.LOOKUP_COLOR))
+
 
 async def notification_callback(bridge: gb.Bridge, **signal):
     """Callback for Received Notifications
 
     Different colors are displayed depending on the id of the receiving bridge 
     """
+    # Skip the name resolution and formatting when INFO is suppressed
+    if gb.logger.disabled or not gb.logger.isEnabledFor(logging.INFO):
+        return
+
     stone = signal.get("Stone")
     color = signal.get("Color")
 
-    try:
-        color_lookup = gravitrax_constants.LOOKUP_COLOR[color]
-    except IndexError:
-        color_lookup = color
-
-    try:
-        stone_lookup = gravitrax_constants.DICT_VAL_STONE[stone]
-    except KeyError:
-        stone_lookup = stone
+    color_lookup = COLOR_TABLE.get(color, color)
+    stone_lookup = gravitrax_constants.DICT_VAL_STONE.get(stone, stone)
 
     if (bridge.id == 0 and color != gravitrax_constants.COLOR_BLUE) or (
         bridge.id == 1 and color == gravitrax_constants.COLOR_BLUE
@@ -41,23 +43,26 @@ async def main():
     """Connect to all available bridges and split them in 2 groups
     """
     try:
-        b_list = [gb.Bridge()]
-        index = 0
         gb.log_set_level("DEBUG")
         gb.logger.disabled = False
         gb.log_print("Searching for Bridges")
-        # Connect to all available Bridges
-
-        while await b_list[index].connect(timeout=15):
-            new_bridge = gb.Bridge()
-            b_list.append(new_bridge)
-            index += 1
-
-        if len(b_list) > 0:
-            b_list.pop()  # Removing the last element that could not connect
+        # One scan finds every Bridge, then the connects run in parallel
+        # instead of paying the connect timeout once per Bridge
+        addrs = await gb.scan_bridges(timeout=10)
+        bridges = [gb.Bridge() for _ in addrs]
+        limit = asyncio.Semaphore(4)
+
+        async def connect_one(bridge, addr):
+            async with limit:
+                return await bridge.connect(addr, by_name=False, timeout=15)
+
+        results = await asyncio.gather(
+            *(connect_one(bridge, addr) for bridge, addr in zip(bridges, addrs))
+        )
+        b_list = [bridge for bridge, connected in zip(bridges, results) if connected]
 
-        for bridge in b_list:
-            bridge.id = b_list.index(bridge) % 2  # Bridges get 2 Different IDs
+        for i, bridge in enumerate(b_list):
+            bridge.id = i % 2  # Bridges get 2 Different IDs
             await bridge.notification_enable(notification_callback)
 
         await asyncio.sleep(10.0)
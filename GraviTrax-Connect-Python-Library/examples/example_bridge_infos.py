@@ -14,29 +14,43 @@ async def main():
     """Connect to all available Bridges and read out information     
     """
     try:
-        bridges = [gb.Bridge()]
         gb.logger.disabled = False
-        index = 0
 
         gb.log_print("Searching for Bridge")
 
-        while await bridges[index].connect(timeout=10, try_reconnect=False):
-            gb.log_print("Searching for more Bridges")
-            new_bridge = gb.Bridge()
-            bridges.append(new_bridge)
-            index += 1
+        # One scan finds every Bridge, then the connects run in parallel
+        # instead of paying the connect timeout once per Bridge
+        addrs = await gb.scan_bridges(timeout=10)
+        candidates = [gb.Bridge() for _ in addrs]
+        limit = asyncio.Semaphore(4)
 
-        bridges.pop()
+        async def connect_one(bridge, addr):
+            async with limit:
+                return await bridge.connect(
+                    addr, by_name=False, timeout=10, try_reconnect=False
+                )
+
+        results = await asyncio.gather(
+            *(connect_one(bridge, addr) for bridge, addr in zip(candidates, addrs))
+        )
+        bridges = [
+            bridge for bridge, connected in zip(candidates, results) if connected
+        ]
         gb.log_print(f"{len(bridges)} Bridges found")
 
         for bridge in bridges:
-            gb.log_print(await bridge.request_battery_string(), bridge=bridge)
+            # The battery and version requests are independent round trips,
+            # so they run concurrently instead of back to back
+            battery, info = await asyncio.gather(
+                bridge.request_battery_string(), bridge.request_bridge_info()
+            )
+            gb.log_print(battery, bridge=bridge)
 
             # Getting the Firmware and Hardware Version from the Member variables
             # that are set after connecting to the bridge
             gb.log_print(f"Firmware: {bridge.firmware} Hardware: {bridge.hardware}")
-            # Requesting the current Firmware/ Hardware Version from the Bridge
-            if (await bridge.request_bridge_info())[0] >= 14:
+            # The current Firmware/ Hardware Version requested from the Bridge
+            if info[0] >= 14:
                 gb.log_print("Firmware 14 or newer is used")
 
             await bridge.disconnect()
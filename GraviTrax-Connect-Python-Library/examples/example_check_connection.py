@@ -1,6 +1,6 @@
 """Connection Check example Script
-Running Code in a continuos loop that checks if 
-the bridge is still connected
+Displays for how long the bridge is connected and reacts to the
+disconnect through the disconnect callback
 """
 import asyncio
 import sys
@@ -14,14 +14,28 @@ async def main():
     bridge = gb.Bridge()
     gb.logger.disabled = False
     try:
-        await bridge.connect()
+        loop = asyncio.get_running_loop()
+        dc_event = asyncio.Event()
+        if not await bridge.connect(dc_callback=lambda b, **kwargs: dc_event.set()):
+            return
 
         timer = 0
-        while await bridge.is_connected():
+
+        def tick():
+            """Update the connection counter once per second"""
+            nonlocal timer
+            if dc_event.is_set():
+                return
+            # The line has no newline, so it must be flushed explicitly to
+            # show up every second
             sys.stdout.write(f"\rConnected for {timer} seconds")
             sys.stdout.flush()
             timer += 1
-            await asyncio.sleep(1)
+            loop.call_later(1, tick)
+
+        tick()
+        # Instead of polling is_connected the disconnect callback ends the wait
+        await dc_event.wait()
     except asyncio.CancelledError:
         return
 
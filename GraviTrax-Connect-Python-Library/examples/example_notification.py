@@ -7,6 +7,7 @@ can be accessed as Keyword Arguments. The program closes after
 """
 
 import asyncio
+import logging
 
 from gravitraxconnect import gravitrax_bridge as gb
 from gravitraxconnect import gravitrax_constants
@@ -15,6 +16,10 @@ counter = 0
 finished = asyncio.Event()
 disconnected = asyncio.Event()
 
+# Color names keyed by value so unknown signal values fall back with a
+# plain dict lookup instead of a caught exception per notification
+COLOR_TABLE = dict(enumerate(gravitrax_constants.LOOKUP_COLOR))
+
 
 def disconnect_callback(bridge: gb.Bridge, **kwargs):
     """Callback function for disconnects"""
@@ -29,27 +34,23 @@ async def notification_callback(bridge: gb.Bridge, **signal):
     """
     global counter
 
-    def lookup(key, table, prefix):
-        try:
-            return table[key]
-        except (IndexError, KeyError):
-            if prefix:
-                return f"{prefix}{key}"
-            return key
-
     counter += 1
     # Received Data doesn't fits the communication protocol
     if not (data := signal.get("Header")):
         gb.log_print(f"Received Notification: {data}", bridge=bridge)
     # Received Data does fits the communication protocol
-    else:
+    # The lookups and formatting are skipped when INFO is suppressed
+    elif not gb.logger.disabled and gb.logger.isEnabledFor(logging.INFO):
         # Access relevant Signal information
         # Other kwargs that can be accessed are:
         # Header, Reserved, id and Checksum
-        stone = lookup(signal.get("Stone"), gravitrax_constants.DICT_VAL_STONE, None)
-        color = lookup(signal.get("Color"), gravitrax_constants.LOOKUP_COLOR, None)
-        status = lookup(
-            signal.get("Status"), gravitrax_constants.DICT_VAL_STATUS, "Color"
+        stone_value = signal.get("Stone")
+        color_value = signal.get("Color")
+        status_value = signal.get("Status")
+        stone = gravitrax_constants.DICT_VAL_STONE.get(stone_value, stone_value)
+        color = COLOR_TABLE.get(color_value, color_value)
+        status = gravitrax_constants.DICT_VAL_STATUS.get(
+            status_value, f"Color{status_value}"
         )
 
         # Printing information about the received signal
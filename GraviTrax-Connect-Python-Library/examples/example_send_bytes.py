@@ -25,8 +25,13 @@ async def main():
     gb.logger.disabled = False
     try:
         await bridge.connect()
+        # Build the message once and patch the id and checksum in place
+        # instead of allocating a fresh bytes object per iteration
+        buf = bytearray([19, 8, 0, 0, 0, 0, 1])
         for i in range(13):
-            data = gb.add_checksum(bytes([19, 8, 0, 0, i, 0, 1]))
+            buf[4] = i
+            buf[5] = (buf[0] + buf[1] + buf[2] + buf[3] + buf[4]) % 256
+            data = bytes(buf)
             gb.log_print(f"Sending {i}: {data}", bridge=bridge)
             await bridge.send_bytes(data)
             await asyncio.sleep(0.2)
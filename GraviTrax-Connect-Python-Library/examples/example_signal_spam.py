@@ -11,6 +11,22 @@ from gravitraxconnect import gravitrax_bridge as gb
 from gravitraxconnect import gravitrax_constants
 
 
+async def _warm_cache():
+    """Fill the packet template cache while the connection is made"""
+    for status, color in (
+        (gravitrax_constants.STATUS_STARTER, gravitrax_constants.COLOR_RED),
+        (gravitrax_constants.STATUS_STARTER, gravitrax_constants.COLOR_GREEN),
+        (gravitrax_constants.STATUS_STARTER, gravitrax_constants.COLOR_BLUE),
+        (gravitrax_constants.STATUS_SWITCH, gravitrax_constants.COLOR_RED),
+    ):
+        gb._signal_template(
+            gravitrax_constants.MSG_DEFAULT_HEADER,
+            gravitrax_constants.STONE_BRIDGE,
+            status,
+            color,
+        )
+
+
 async def main():
     """ Repeatedly send signals in different colors
     """
@@ -18,20 +34,21 @@ async def main():
     gb.log_print("Searching for Bridge")
     bridge = gb.Bridge()
     try:
-        if await bridge.connect():
-            for _ in range(7):
-                if not await bridge.send_signal(
-                    gravitrax_constants.STATUS_STARTER, gravitrax_constants.COLOR_RED
-                ):
-                    break
-                if not await bridge.send_signal(
-                    gravitrax_constants.STATUS_STARTER, gravitrax_constants.COLOR_GREEN
-                ):
-                    break
-                if not await bridge.send_signal(
-                    gravitrax_constants.STATUS_STARTER, gravitrax_constants.COLOR_BLUE
-                ):
-                    break
+        # The cache warmup runs during the I/O waits of the connection
+        connected, _ = await asyncio.gather(bridge.connect(), _warm_cache())
+        if connected:
+            # One batched call submits all 21 Signals back to back
+            await bridge.send_signals(
+                [
+                    (gravitrax_constants.STATUS_STARTER, color)
+                    for color in (
+                        gravitrax_constants.COLOR_RED,
+                        gravitrax_constants.COLOR_GREEN,
+                        gravitrax_constants.COLOR_BLUE,
+                    )
+                ]
+                * 7
+            )
             await asyncio.sleep(1)
             await bridge.send_periodic(
                 gravitrax_constants.STATUS_SWITCH,
@@ -16,13 +16,34 @@ from gravitraxconnect import gravitrax_bridge as gb
 from gravitraxconnect import gravitrax_constants
 
 
+async def _warm_cache():
+    """Fill the packet template cache while the connection is made"""
+    for color in (
+        gravitrax_constants.COLOR_RED,
+        gravitrax_constants.COLOR_GREEN,
+        gravitrax_constants.COLOR_BLUE,
+    ):
+        gb._signal_template(
+            gravitrax_constants.MSG_DEFAULT_HEADER,
+            gravitrax_constants.STONE_BRIDGE,
+            gravitrax_constants.STATUS_ALL,
+            color,
+        )
+
+
 async def main():
     """Send a Signal Sequence of red, green and blue signals
     """
     bridge = gb.Bridge()
     gb.logger.disabled = False
     try:
-        if await bridge.connect():
+        # The cache warmup runs during the I/O waits of the connection
+        connected, _ = await asyncio.gather(bridge.connect(), _warm_cache())
+        if connected:
+            # The pauses aim at absolute deadlines, so the time spent
+            # sending does not push the cycle starts off their 6s grid
+            loop = asyncio.get_running_loop()
+            deadline = loop.time()
             for _ in range(3):
                 gb.log_print("Send RED", bridge=bridge)
                 await bridge.send_signal(
@@ -30,20 +51,26 @@ async def main():
                     gravitrax_constants.COLOR_RED,
                     resends=12,
                 )
-                await asyncio.sleep(3)
+                deadline += 3
+                await asyncio.sleep(max(0, deadline - loop.time()))
                 gb.log_print("Send GREEN and BLUE", bridge=bridge)
-                await bridge.send_signal(
-                    gravitrax_constants.STATUS_ALL,
-                    gravitrax_constants.COLOR_GREEN,
-                    resends=12,
-                )
-                await bridge.send_signal(
-                    gravitrax_constants.STATUS_ALL,
-                    gravitrax_constants.COLOR_BLUE,
-                    resends=12,
-                    resend_gap=0,
+                # Both sends run concurrently; the transport lock inside the
+                # Bridge keeps their writes ordered on the connection
+                await asyncio.gather(
+                    bridge.send_signal(
+                        gravitrax_constants.STATUS_ALL,
+                        gravitrax_constants.COLOR_GREEN,
+                        resends=12,
+                    ),
+                    bridge.send_signal(
+                        gravitrax_constants.STATUS_ALL,
+                        gravitrax_constants.COLOR_BLUE,
+                        resends=12,
+                        resend_gap=0,
+                    ),
                 )
-                await asyncio.sleep(3)
+                deadline += 3
+                await asyncio.sleep(max(0, deadline - loop.time()))
 
             await bridge.disconnect()
     except asyncio.CancelledError:
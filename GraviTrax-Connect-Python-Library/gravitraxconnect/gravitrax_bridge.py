@@ -16,6 +16,7 @@ Bridge Class:
     - try_reconnect: Try to reconnect after disconnect(Bool)   
     - restart_notifications: Restart Notifications after reconnect(Bool)
     - noti_callback: Callback function for Notifications
+    - noti_batch_callback: Callback function for batched Notifications
 
     Methods:
     - connect(): Connect to a Bridge by name or MAC-Address
@@ -47,8 +48,15 @@ Utility Functions:
 import random
 import re
 import logging
+import logging.handlers
 import platform
 import asyncio
+import time
+import functools
+import queue
+import atexit
+
+from collections import deque
 
 from bleak import BleakScanner, BleakClient
 from bleak.exc import BleakError, BleakDeviceNotFoundError
@@ -69,9 +77,60 @@ stream_handler.setFormatter(
     )
 )
 stream_handler.setLevel(logging.INFO)
-logger.addHandler(stream_handler)
+# Records are handed to a background thread, so the blocking stdout write
+# never runs on the thread of the event loop
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, stream_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+queue_handler = logging.handlers.QueueHandler(_log_queue)
+queue_handler.name = f"{__name__}_queue_handler"
+logger.addHandler(queue_handler)
 logger.disabled = True
 
+# Compiled once so the error handling does not pay the pattern cache
+# lookup on every use
+_CHAR_NOT_FOUND_RE = re.compile(r"Characteristic [\-\w]* was not found!")
+
+# The platform cannot change at runtime, so it is looked up once instead
+# of per connect
+_IS_LINUX = platform.system() == "Linux"
+
+
+async def _precise_sleep(seconds: float) -> None:
+    """Sleep with sub-millisecond accuracy.
+
+    asyncio.sleep alone overshoots small delays by the scheduler slack,
+    which causes large relative jitter on short resend gaps. The bulk of
+    the delay is slept normally and only the final approach is spent
+    spinning on the clock.
+    """
+    cutoff = 2e-4
+    if seconds > cutoff:
+        await asyncio.sleep(seconds - cutoff)
+    end = time.perf_counter() + min(seconds, cutoff)
+    while time.perf_counter() < end:
+        pass
+
+
+@functools.lru_cache(maxsize=64)
+def _signal_template(
+    header: int, stone: int, status: int, color_channel: int
+) -> tuple[bytes, int]:
+    """Return the constant packet bytes and their checksum contribution.
+
+    The reserved byte, message id and checksum change with every send, so
+    only the constant part of the packet can be cached. Repeated sends
+    with the same parameters reuse the template and the partial checksum
+    instead of rebuilding them.
+    """
+    return (
+        bytes([header, stone, status, 0, 0, 0, color_channel]),
+        header + stone + status,
+    )
+
 
 class Bridge:
     def __init__(self):
@@ -84,13 +143,20 @@ class Bridge:
         self.try_reconnect = False  # Reconnect after connection loss
         self.restart_notifications = True  # Restart Notifications after reconnect
         self.noti_callback = None  # Callback function for Notifications
-        # Lock for exclusive access to __last_notification
-        self.__noti_lock = asyncio.Lock()
+        self.noti_batch_callback = None  # Callback for batched Notifications
         self.__send_lock = asyncio.Lock()  # Lock for exclusive access to __next_send_id
+        self.__tx_lock = asyncio.Lock()  # Serializes the GATT writes of concurrent sends
         self.__address = None  # MAC-Address of the connected Bridge
         self.__next_send_id = 0  # Message-ID for the next send signal.
         self.__user_disconnected = False  # If the user called disconnect()
-        self.__last_notifications = []
+        # Ring of the last received frames plus a mirroring set so the
+        # dedupe check in the notification handler stays O(1)
+        self.__last_notifications = deque(maxlen=12)
+        self.__last_noti_set = set()
+        self.__inflight = {}  # Futures of deduplicated in-flight sends
+        self.__tx_buf = bytearray(7)  # Reused build buffer for outgoing packets
+        self.__tx_queue = None  # Queue of pending fire and forget sends
+        self.__writer_task = None  # Task draining __tx_queue
 
     async def connect(
         self,
@@ -162,7 +228,7 @@ class Bridge:
         self.__user_disconnected = False
         self.name = device.name
         self.__address = device.address
-        if platform.system() == "Linux":
+        if _IS_LINUX and hasattr(self.client._backend, "_acquire_mtu"):
             await self.client._backend._acquire_mtu()
         log_print(
             "Connected to bridge",
@@ -227,6 +293,11 @@ class Bridge:
             return False
         if _user:
             self.__user_disconnected = True
+        if self.__writer_task is not None and not self.__writer_task.done():
+            # Let queued fire and forget sends go out before the link drops
+            await self.__tx_queue.join()
+            self.__writer_task.cancel()
+            self.__writer_task = None
         try:
             log_print("Disconnecting", bridge=self, level="DEBUG")
             await asyncio.wait_for(
@@ -280,7 +351,14 @@ class Bridge:
             )
         if (not self.__user_disconnected) and self.try_reconnect:
             log_print("Trying to reconnect", bridge=self)
-            asyncio.get_running_loop().create_task(self.__reconnect(client.address))
+            loop = asyncio.get_running_loop()
+            try:
+                # The eager factory runs the reconnect up to its first
+                # real await before returning instead of waiting for the
+                # next scheduler pass (Python 3.12+)
+                asyncio.eager_task_factory(loop, self.__reconnect(client.address))
+            except AttributeError:
+                loop.create_task(self.__reconnect(client.address))
 
     async def __reconnect(self, address: str) -> None:
         """Reconnect to the bridge after a disconnect.
@@ -313,11 +391,14 @@ class Bridge:
                 )
             return
         log_print("Reconnected to Bridge", bridge=self)
-        if self.restart_notifications and self.noti_callback:
-            await self.notification_enable(self.noti_callback)
+        if self.restart_notifications:
+            if self.noti_batch_callback:
+                await self.notification_enable(self.noti_batch_callback, batched=True)
+            elif self.noti_callback:
+                await self.notification_enable(self.noti_callback)
 
     async def notification_enable(
-        self, callback, uuid: str = gravitrax_constants.UUID_NOTIF
+        self, callback, uuid: str = gravitrax_constants.UUID_NOTIF, batched: bool = False
     ) -> bool:
         """Enable Notifications from the bridge.
 
@@ -326,6 +407,10 @@ class Bridge:
             received.
             - uuid: The uuid to receive Notifications from. Defaults to
             Standard value from gravitrax_constants.py. Needs to be a string.
+            - batched: When enabled the callback is called once per received
+            Notification with a list of all Signals it contained instead of
+            once per Signal. The callback receives the keyword arguments
+            signals (a list of dicts with the usual signal keys) and Data.
 
         Returns:
             - True: Successfully enabled the notifications.
@@ -357,7 +442,12 @@ class Bridge:
             return False
 
         log_print("Notifications Enabled", bridge=self, level="INFO")
-        self.noti_callback = callback
+        if batched:
+            self.noti_batch_callback = callback
+            self.noti_callback = None
+        else:
+            self.noti_callback = callback
+            self.noti_batch_callback = None
         return True
 
     async def notification_disable(
@@ -415,75 +505,98 @@ class Bridge:
             Library
             - data: Bytearray containing the Data of the Notification
         """
-        message = " ".join("{:02x}".format(x) for x in data)
-        # Check if data conforms to Gravitrax Signal Protocol
-
-        recv_signals = [
-            match.group() for match in re.finditer(r"13(\s[0-9a-fA-F]{2}){6}", message)
-        ]
+        # Check if data conforms to Gravitrax Signal Protocol. The raw
+        # bytes are scanned directly for 7 byte frames starting with the
+        # message header
+        recv_signals = []
+        i = 0
+        limit = len(data) - 7
+        while (i := data.find(0x13, i)) != -1 and i <= limit:
+            recv_signals.append(bytes(data[i : i + 7]))
+            i += 7
 
         if len(recv_signals) == 0:
-            await self.noti_callback(
-                self,
-                Header=None,
-                Stone=None,
-                Status=None,
-                Reserved=None,
-                Id=None,
-                Checksum=None,
-                Color=None,
-                Data=data,
-            )
+            try:
+                if self.noti_batch_callback:
+                    await self.noti_batch_callback(self, signals=[], Data=data)
+                else:
+                    await self.noti_callback(
+                        self,
+                        Header=None,
+                        Stone=None,
+                        Status=None,
+                        Reserved=None,
+                        Id=None,
+                        Checksum=None,
+                        Color=None,
+                        Data=data,
+                    )
+            except TypeError as exc:
+                log_print(
+                    f"Failed to call notification callback: {str(exc)}",
+                    bridge=self,
+                    level="ERROR",
+                )
             return
 
-        await self.__noti_lock.acquire()
-        try:
+        # Notifications are dispatched one after another on the event loop
+        # and the dedupe bookkeeping below never awaits, so no lock is
+        # needed around it
+        signals = []
+        for recv_signal in recv_signals:
+
+            # Check if the same Signal was already received
+            if recv_signal in self.__last_noti_set:
+                continue
+            if len(self.__last_notifications) == 12:
+                self.__last_noti_set.discard(self.__last_notifications[0])
+            self.__last_notifications.append(recv_signal)
+            self.__last_noti_set.add(recv_signal)
+
+            # Header, Stonetype, Status, Reserved, Message ID,
+            # Checksum, Color - the frame bytes already are integers
+            signal = list(recv_signal)
+
+            if signal[5] != calc_checksum(recv_signal, for_received=True):
+                log_print(
+                    "Incoming Notification was discarded because the Checksum was incorrect",
+                    level="DEBUG",
+                )
 
-            for recv_signal in recv_signals:
-
-                # Check if the same Signal was already received
-                if recv_signal in self.__last_notifications:
-                    continue
-                self.__last_notifications.append(recv_signal)
-                while len(self.__last_notifications) > 12:
-                    self.__last_notifications.pop(0)
-
-                signal = [
-                    int(recv_signal[0:2], base=16),  # 0.Header
-                    int(recv_signal[3:5], base=16),  # 1.Stonetype
-                    int(recv_signal[6:8], base=16),  # 2.Status
-                    int(recv_signal[9:11], base=16),  # 3.Reserved
-                    int(recv_signal[12:14], base=16),  # 4.Message ID
-                    int(recv_signal[15:17], base=16),  # 5.Checksum
-                    int(recv_signal[18:20], base=16),  # 6.Color
-                ]
-
-                if signal[5] != calc_checksum(signal, for_received=True):
-                    log_print(
-                        "Incoming Notification was discarded because the Checksum was incorrect",
-                        level="DEBUG",
-                    )
+            signals.append(
+                {
+                    "Header": signal[0],
+                    "Stone": signal[1],
+                    "Status": signal[2],
+                    "Reserved": signal[3],
+                    "Id": signal[4],
+                    "Checksum": signal[5],
+                    "Color": signal[6],
+                }
+            )
 
+        if self.noti_batch_callback:
+            # One awaitable covers all Signals of the packet
+            if signals:
                 try:
-                    await self.noti_callback(
-                        self,
-                        Header=signal[0],
-                        Stone=signal[1],
-                        Status=signal[2],
-                        Reserved=signal[3],
-                        Id=signal[4],
-                        Checksum=signal[5],
-                        Color=signal[6],
-                        Data=data,
-                    )
+                    await self.noti_batch_callback(self, signals=signals, Data=data)
                 except TypeError as exc:
                     log_print(
                         f"Failed to call notification callback: {str(exc)}",
                         bridge=self,
                         level="ERROR",
                     )
-        finally:
-            self.__noti_lock.release()
+            return
+
+        for signal_kwargs in signals:
+            try:
+                await self.noti_callback(self, **signal_kwargs, Data=data)
+            except TypeError as exc:
+                log_print(
+                    f"Failed to call notification callback: {str(exc)}",
+                    bridge=self,
+                    level="ERROR",
+                )
 
     async def send_bytes(
         self,
@@ -511,9 +624,23 @@ class Bridge:
             # Sending a Message multiple times reduces the odds for package
             # loss to occur. If the Bridge receives an identical message
             # more then once in a span of 12 non-identical Messages it is discarded.
-            for _ in range(resends):
-                await self.client.write_gatt_char(uuid, data)
-                await asyncio.sleep(resend_gap)
+            if resend_gap == 0:
+                # Without a gap the burst is queued back to back with
+                # unacknowledged writes instead of paying a full
+                # acknowledgement round trip per resend; one lock
+                # acquisition covers the whole burst
+                async with self.__tx_lock:
+                    for _ in range(resends):
+                        await self.client.write_gatt_char(uuid, data, response=False)
+                await asyncio.sleep(0)
+            else:
+                for _ in range(resends):
+                    # Only the write itself is guarded, so concurrent sends
+                    # can prepare their packets while another transmission
+                    # is on air
+                    async with self.__tx_lock:
+                        await self.client.write_gatt_char(uuid, data)
+                    await _precise_sleep(resend_gap)
         except (TypeError, BleakError) as exc:
             if isinstance(error_event, asyncio.Event):
                 error_event.set()
@@ -544,6 +671,8 @@ class Bridge:
         header: int = gravitrax_constants.MSG_DEFAULT_HEADER,
         stone: int = gravitrax_constants.STONE_BRIDGE,
         error_event: asyncio.Event = None,
+        dedup: bool = False,
+        fire_and_forget: bool = False,
     ) -> None:
         """Send a Signal to a Bridge
 
@@ -571,31 +700,163 @@ class Bridge:
             the value of the Bridge Stone.
             - error_event: A asyncio.Event that is set when a error happens
             during the send operation
+            - dedup: When enabled, identical Signals that are send while an
+            equal one is still in flight share that transmission instead of
+            producing another one. The resends of the running transmission
+            already cover the duplicate.
+            - fire_and_forget: When enabled the Signal is handed to a
+            background writer task and the call returns immediately instead
+            of waiting for the transmission. disconnect() waits until all
+            queued Signals are send.
 
         Instance variables:
 
             - __next_send_id (set, read): The message id for the next send signal if
             random_id is set to false
+            - __inflight (set, read): Shared futures of deduplicated sends
+            - __tx_buf (set, read): Reused build buffer for outgoing packets
+            - __tx_queue (set, read): Queue of pending fire and forget sends
+            - __writer_task (set, read): Task draining __tx_queue
         """
+        if fire_and_forget:
+            if self.__writer_task is None or self.__writer_task.done():
+                self.__tx_queue = asyncio.Queue()
+                self.__writer_task = asyncio.create_task(self.__drain_sends())
+            self.__tx_queue.put_nowait(
+                (
+                    status,
+                    color_channel,
+                    resends,
+                    resend_gap,
+                    random_id,
+                    uuid,
+                    header,
+                    stone,
+                    error_event,
+                )
+            )
+            return
+        if dedup:
+            key = (status, color_channel, resends, resend_gap, stone)
+            if (pending := self.__inflight.get(key)) is not None:
+                await pending
+                return
+            future = asyncio.get_running_loop().create_future()
+            self.__inflight[key] = future
+            try:
+                await self.send_signal(
+                    status,
+                    color_channel,
+                    resends=resends,
+                    resend_gap=resend_gap,
+                    random_id=random_id,
+                    uuid=uuid,
+                    header=header,
+                    stone=stone,
+                    error_event=error_event,
+                )
+            finally:
+                del self.__inflight[key]
+                future.set_result(None)
+            return
+
+        template, checksum_base = _signal_template(header, stone, status, color_channel)
         reserved = random.randrange(0, 255)
         await self.__send_lock.acquire()
         if random_id:
             message_id = random.randrange(0, 255)
         else:
             message_id = self.__next_send_id
-        self.__next_send_id = (self.__next_send_id + 1) % 256
+        self.__next_send_id = (self.__next_send_id + 1) & 0xFF
+        # The build buffer is shared between sends, so it is filled while
+        # the lock is still held; only the final immutable copy escapes
+        buf = self.__tx_buf
+        buf[:] = template
+        buf[3] = reserved
+        buf[4] = message_id
+        buf[5] = (checksum_base + reserved + message_id) & 0xFF
+        data = bytes(buf)
         self.__send_lock.release()
-        checksum = (header + stone + status + reserved + message_id) % 256
         await self.send_bytes(
-            bytes(
-                [header, stone, status, reserved, message_id, checksum, color_channel]
-            ),
+            data,
             uuid=uuid,
             resends=resends,
             resend_gap=resend_gap,
             error_event=error_event,
         )
 
+    async def __drain_sends(self) -> None:
+        """Send queued fire and forget Signals one after another.
+
+        Runs as a background task once the first fire and forget Signal is
+        submitted and keeps draining the queue until it is cancelled on
+        disconnect.
+
+        Instance variables:
+
+            - __tx_queue (read): Queue of pending fire and forget sends
+        """
+        while True:
+            args = await self.__tx_queue.get()
+            try:
+                status, color_channel, resends, resend_gap = args[:4]
+                random_id, uuid, header, stone, error_event = args[4:]
+                await self.send_signal(
+                    status,
+                    color_channel,
+                    resends=resends,
+                    resend_gap=resend_gap,
+                    random_id=random_id,
+                    uuid=uuid,
+                    header=header,
+                    stone=stone,
+                    error_event=error_event,
+                )
+            finally:
+                self.__tx_queue.task_done()
+
+    async def send_signals(
+        self,
+        signals,
+        resends: int = 12,
+        resend_gap: float = 0,
+        stone: int = gravitrax_constants.STONE_BRIDGE,
+    ) -> bool:
+        """Send multiple Signals back to back.
+
+        The Bridge protocol carries one message per GATT write, so the
+        batch is submitted as consecutive writes within one call instead
+        of one awaited send_signal per Signal.
+
+        Args:
+            - signals: Iterable of (status, color) tuples that are send
+            in order
+            - resends: How often a signal with the same data should be resend.
+            Setting a higher value here helps to decrease package loss at
+            the cost of reduced throughput when sending multiple Signals.
+            - resend_gap: Additional delay in seconds between every resend of
+            a signal
+            - stone: Specifies the Stonetype of the send signals. Defaults to
+            the value of the Bridge Stone.
+
+        Returns: Boolean
+            - True: All Signals were send
+            - False: A send operation failed
+        """
+        error_event = asyncio.Event()
+        for status, color_channel in signals:
+            await self.send_signal(
+                status,
+                color_channel,
+                resends=resends,
+                resend_gap=resend_gap,
+                stone=stone,
+                error_event=error_event,
+            )
+            if error_event.is_set():
+                return False
+        return True
+
     async def send_periodic(
         self,
         status: int,
@@ -606,6 +867,7 @@ class Bridge:
         resend_gap: float = 0,
         stone: int = gravitrax_constants.STONE_BRIDGE,
         stop_on_failure: bool = True,
+        min_interval: float = 0.001,
     ) -> None:
         """Send multiple Signals with a time gap in between.
 
@@ -625,15 +887,28 @@ class Bridge:
             - stop_on_failure: Specifies whether the function should continue
             to run if there was an error during one send operation(usually
             because the used bridge was disconnected)
+            - min_interval: Lower bound in seconds for the spacing between
+            resends. With resend_gap=0 the resends would be submitted as
+            fast as the loop can turn, which stalls the transmission on
+            slow adapters. Set to 0 to disable the floor.
         """
+        if resend_gap < min_interval:
+            resend_gap = min_interval
         error_event = asyncio.Event()
+        # The sends are paced against absolute deadlines so the duration
+        # of a send does not drift the whole train
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         for i in range(count):
             # Handling of a failed Transmission
             if stop_on_failure and error_event.is_set():
                 return
 
             if gap > 0 and i > 0:
-                await asyncio.sleep(gap)
+                deadline += gap
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await _precise_sleep(delay)
             await self.send_signal(
                 status,
                 color_channel,
@@ -692,7 +967,7 @@ class Bridge:
             return None
         except BleakError as exc:
             err_text = str(exc)
-            if re.match(r"Characteristic [\-\w]* was not found!", err_text):
+            if _CHAR_NOT_FOUND_RE.match(err_text):
                 err_text = "Characteristic not found. Make sure the bridge is connected"
 
             log_print(
@@ -887,9 +1162,13 @@ def calc_checksum(data: bytes, for_received: bool = False) -> int | None:
     """
     if len(data) != 7:
         return None
-    checksum = (data[0] + data[1] + data[2] + data[3] + data[4]) % 256
+    if isinstance(data, (bytes, bytearray)):
+        # sum() iterates bytes objects at C speed
+        checksum = sum(data[:5]) & 0xFF
+    else:
+        checksum = (data[0] + data[1] + data[2] + data[3] + data[4]) & 0xFF
     if for_received:
-        checksum = (checksum + data[6] - 1) % 256
+        checksum = (checksum + data[6] - 1) & 0xFF
     return checksum
 
 
@@ -927,6 +1206,8 @@ def log_print(*text, bridge: Bridge = None, level: (str | int) = "INFO") -> None
         bridge: Bridge object. Used to print the address in front of logging messages
         level: The logging level for the message.
     """
+    if logger.disabled:  # Skip building the message when nothing is logged
+        return
     msg = ""
     for t in text:
         msg = msg + str(t)
@@ -953,8 +1234,6 @@ def log_set_level(level: (str | int) = "DEBUG") -> None:
     """
     try:
         logger.setLevel(level)
-        for handler in logger.handlers:
-            if handler.name == f"{__name__}_stream_handler":
-                handler.setLevel(level)
+        stream_handler.setLevel(level)
     except (TypeError, ValueError):
         log_print(f"Logging level can´t be set to {level} ", level="ERROR")